@@ -10,15 +10,26 @@ Usage:
 
 Dependencies:
     pip install requests beautifulsoup4 lxml python-dateutil
+    pip install selectolax  # optional, much faster HTML parsing
+    pip install aiohttp     # optional, fetches article pages concurrently
+    pip install brotli      # optional, accepts brotli-compressed responses
 """
 
+import asyncio
+import json
+import os
 import re
 import sys
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, NavigableString, Tag
+import soupsieve as sv
 from datetime import datetime, timezone, timedelta
-from urllib.parse import urljoin, urlparse
-import xml.etree.ElementTree as ET
+from email.utils import format_datetime
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
+from itertools import chain
+from xml.sax.saxutils import escape, quoteattr
 
 try:
     from dateutil import parser as date_parser
@@ -29,19 +40,166 @@ except ImportError:
     HAS_DATEUTIL = False
     HAS_PYTZ = False
 
+try:
+    import lxml  # noqa: F401 - only needed as a BeautifulSoup tree builder
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Only advertise brotli when a decoder is installed for requests/aiohttp to use
+try:
+    import brotli  # noqa: F401
+    HAS_BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        HAS_BROTLI = True
+    except ImportError:
+        HAS_BROTLI = False
+
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    HAS_SELECTOLAX = True
+except ImportError:
+    HAS_SELECTOLAX = False
+
+# Article container selectors, in order of preference
+ARTICLE_SELECTORS = [
+    'article',
+    '.post',
+    '.news-item',
+    '.entry',
+    '[class*="post"]',
+    '[class*="article"]',
+    '[class*="news"]'
+]
+
+# Title candidates within an article: headings are preferred, then links,
+# then elements with a title-like class (see _pick_title)
+TITLE_SELECTOR = 'h1, h2, h3, h4, a, [class*="title" i], [class*="headline" i]'
+_HEADING_TAGS = {'h1', 'h2', 'h3', 'h4'}
+
+# Selectors for the BeautifulSoup path, compiled once
+_TITLE_SELECTOR = sv.compile(TITLE_SELECTOR)
+_ARTICLE_SELECTOR_PRIORITY = [sv.compile(selector) for selector in ARTICLE_SELECTORS]
+_LINK_SELECTOR = sv.compile('a[href]')
+
+# Precompiled patterns used while extracting article details; a "Posted on"
+# date takes precedence over any other date in the text
+_POSTED_ON_RE = re.compile(r'Posted on ([A-Za-z]+ \d{1,2}, \d{4})', re.I)
+_DATE_PATTERNS = [_POSTED_ON_RE] + [re.compile(p, re.I) for p in (
+    r'Published on ([A-Za-z]+ \d{1,2}, \d{4})',
+    r'([A-Za-z]+ \d{1,2}, \d{4})',
+    r'(\d{1,2}/\d{1,2}/\d{4})',
+    r'(\d{4}-\d{1,2}-\d{1,2})'
+)]
+_POSTED_PREFIX_RE = re.compile(r'^(?:Posted|Published) on [A-Za-z]+ \d{1,2}, \d{4}\s*', re.I)
+_MONTH_DAY_YEAR_RE = re.compile(r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})')
+
+_MONTH_MAP = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4,
+    'may': 5, 'june': 6, 'july': 7, 'august': 8,
+    'september': 9, 'october': 10, 'november': 11, 'december': 12,
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+
+# RSS 2.0 has a fixed shape, so the feed is rendered from templates
+_RSS_HEADER_TMPL = '''<?xml version="1.0" encoding="utf-8"?>
+<rss xmlns:atom="http://www.w3.org/2005/Atom" version="2.0">
+  <channel>
+    <title>City of Belvedere News</title>
+    <link>{link}</link>
+    <description>Official news and updates from the City of Belvedere, California</description>
+    <language>en-us</language>
+    <lastBuildDate>{last_build_date}</lastBuildDate>
+    <managingEditor>clerk@cityofbelvedere.org (City of Belvedere)</managingEditor>
+    <webMaster>clerk@cityofbelvedere.org (City of Belvedere)</webMaster>
+    <atom:link href={self_link} rel="self" type="application/rss+xml" />
+'''
+_ITEM_TMPL = '''    <item>
+      <title>{title}</title>
+      <link>{link}</link>
+      <description>{description}</description>
+      <pubDate>{pub_date}</pubDate>
+      <guid isPermaLink="true">{link}</guid>
+    </item>
+'''
+_RSS_FOOTER = '''  </channel>
+</rss>
+'''
+
+# Descriptions are cut at DESCRIPTION_LENGTH; collecting a little more text
+# than that is enough to know whether to add an ellipsis
+DESCRIPTION_LENGTH = 500
+TEXT_BUDGET = 600
+
+# Returned by fetch_page when the server answers 304 Not Modified
+NOT_MODIFIED = object()
+
+# HTTP validator cache, kept in the same directory as the feed it belongs to
+CACHE_FILENAME = '.belvedere_cache.json'
+
+# Query parameters that only track the click and never change the page
+_TRACKING_PARAMS = {'fbclid', 'gclid'}
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+def _canonical(url):
+    """Normalize a URL so trivially different links to the same article compare equal"""
+    parts = urlsplit(url)
+    try:
+        port = parts.port
+    except ValueError:
+        return url
+    
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if port and port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+    
+    query = urlencode([(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                       if not key.startswith('utm_') and key not in _TRACKING_PARAMS])
+    return urlunsplit((scheme, host, parts.path or '/', query, ''))
+
 class BelvedereRSSGenerator:
     def __init__(self):
         self.base_url = "https://www.cityofbelvedere.org"
         self.news_url = "https://www.cityofbelvedere.org/news"
         self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+            'Accept-Encoding': 'gzip, deflate, br' if HAS_BROTLI else 'gzip, deflate'
         }
+        # Reuse pooled keep-alive connections and retry transient failures
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Build timestamp (RFC-822), fixed once per run() and used for
+        # lastBuildDate and as the default publication date
+        self._build_time_rfc822 = None
+        # ETag / Last-Modified validators from previous runs, keyed by URL
+        # Validators for the current output file; run() loads them from the cache
+        # file kept next to that output
+        self.cache_file = None
+        self._cache = {}
         # Set up Pacific timezone with proper PST/PDT handling
         if HAS_PYTZ:
             self.pacific_tz = pytz.timezone('America/Los_Angeles')
         else:
             # Fallback: manual PST/PDT calculation
             self.pacific_tz = None
+        self._pacific_tz_fallback_pst = timezone(timedelta(hours=-8))
+        self._pacific_tz_fallback_pdt = timezone(timedelta(hours=-7))
+        # (dst_start, dst_end) per year for the manual fallback
+        self._dst_bounds = {}
     
     def get_pacific_timezone(self, dt=None):
         """Get Pacific timezone (PST/PDT) with proper DST handling"""
@@ -54,213 +212,362 @@ class BelvedereRSSGenerator:
                 dt = datetime.now()
             
             year = dt.year
-            
-            # Calculate DST start (2nd Sunday in March)
-            march_first = datetime(year, 3, 1)
-            days_to_first_sunday = (6 - march_first.weekday()) % 7
-            first_sunday_march = march_first + timedelta(days=days_to_first_sunday)
-            dst_start = first_sunday_march + timedelta(days=7)  # 2nd Sunday
-            
-            # Calculate DST end (1st Sunday in November)
-            november_first = datetime(year, 11, 1)
-            days_to_first_sunday = (6 - november_first.weekday()) % 7
-            dst_end = november_first + timedelta(days=days_to_first_sunday)
+            if year not in self._dst_bounds:
+                # Calculate DST start (2nd Sunday in March)
+                march_first = datetime(year, 3, 1)
+                days_to_first_sunday = (6 - march_first.weekday()) % 7
+                first_sunday_march = march_first + timedelta(days=days_to_first_sunday)
+                dst_start = first_sunday_march + timedelta(days=7)  # 2nd Sunday
+                
+                # Calculate DST end (1st Sunday in November)
+                november_first = datetime(year, 11, 1)
+                days_to_first_sunday = (6 - november_first.weekday()) % 7
+                dst_end = november_first + timedelta(days=days_to_first_sunday)
+                
+                self._dst_bounds[year] = (dst_start, dst_end)
+            dst_start, dst_end = self._dst_bounds[year]
             
             # Check if date is in DST period
             if dst_start <= dt.replace(tzinfo=None) < dst_end:
-                return timezone(timedelta(hours=-7))  # PDT
+                return self._pacific_tz_fallback_pdt
             else:
-                return timezone(timedelta(hours=-8))  # PST
+                return self._pacific_tz_fallback_pst
+    
+    def _pacific_now(self):
+        """Return the current time in Pacific timezone (PST/PDT)"""
+        if HAS_PYTZ:
+            return datetime.now(self.pacific_tz)
+        now = datetime.now(timezone.utc)
+        return now.astimezone(self.get_pacific_timezone(now))
+    
+    def _build_time(self):
+        """Return the run's build time as an RFC-822 date"""
+        return self._build_time_rfc822 or format_datetime(self._pacific_now())
+    
+    def _load_cache(self):
+        """Load saved HTTP validators for every output file, or start empty if there are none"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return entries if isinstance(entries, dict) else {}
+    
+    def _save_cache(self, output_file):
+        """Persist the HTTP validators behind output_file for the next run"""
+        entries = self._load_cache()
+        entries[os.path.basename(output_file)] = self._cache
+        try:
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, indent=2, sort_keys=True)
+        except OSError as e:
+            print(f"Error saving cache {self.cache_file}: {e}")
     
     def fetch_page(self, url):
-        """Fetch the content of a web page"""
+        """Fetch the content of a web page
+        
+        Sends a conditional request when validators for the URL are cached and
+        returns NOT_MODIFIED if the server reports the page is unchanged.
+        """
+        headers = {}
+        validators = self._cache.get(url, {})
+        if 'etag' in validators:
+            headers['If-None-Match'] = validators['etag']
+        if 'last_modified' in validators:
+            headers['If-Modified-Since'] = validators['last_modified']
+        
         try:
-            response = requests.get(url, headers=self.headers, timeout=30)
+            response = self.session.get(url, headers=headers, timeout=30)
+            if response.status_code == 304:
+                return NOT_MODIFIED
             response.raise_for_status()
+            
+            validators = {}
+            if response.headers.get('ETag'):
+                validators['etag'] = response.headers['ETag']
+            if response.headers.get('Last-Modified'):
+                validators['last_modified'] = response.headers['Last-Modified']
+            self._cache[url] = validators
             return response.text
         except requests.RequestException as e:
             print(f"Error fetching {url}: {e}")
             return None
     
+    async def fetch_page_async(self, session, url):
+        """Fetch the content of a web page with aiohttp"""
+        try:
+            async with session.get(url) as response:
+                response.raise_for_status()
+                # A wrong declared charset must not cost us the page
+                return await response.text(errors='replace')
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+    
+    async def fetch_article_details(self, articles):
+        """Fetch article pages concurrently and fill in missing dates and descriptions"""
+        # The connector limit caps concurrent requests to stay polite to the server
+        connector = aiohttp.TCPConnector(limit=10)
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector,
+                                         timeout=timeout) as session:
+            # Article pages only add details, so no single failure may stop the feed
+            pages = await asyncio.gather(
+                *[self.fetch_page_async(session, article['link']) for article in articles],
+                return_exceptions=True)
+        
+        for article, html_content in zip(articles, pages):
+            if isinstance(html_content, BaseException):
+                print(f"Error fetching {article['link']}: {html_content}")
+            elif html_content:
+                try:
+                    self._apply_article_page(article, html_content)
+                except Exception as e:
+                    print(f"Error processing article page {article['link']}: {e}")
+    
+    def _apply_article_page(self, article, html_content):
+        """Fill in an article's missing date and description from its own page"""
+        if HAS_SELECTOLAX:
+            tree = LexborHTMLParser(html_content)
+            meta = {node.attributes.get('property') or node.attributes.get('name'): node.attributes['content']
+                    for node in tree.css('meta[content]')}
+            body = tree.css_first('article, main') or tree.body
+            text = body.text(separator=' ', strip=True) if body else ''
+        else:
+            soup = BeautifulSoup(html_content, HTML_PARSER)
+            meta = {elem.get('property') or elem.get('name'): elem['content']
+                    for elem in soup.find_all('meta', content=True)}
+            body = soup.select_one('article, main') or soup.body
+            text = body.get_text(separator=' ', strip=True) if body else ''
+        
+        if not article['date_found']:
+            published = meta.get('article:published_time')
+            pub_date = self.parse_date_string(published) if published else None
+            pub_date = pub_date or self.extract_date_from_text(text)
+            if pub_date:
+                article['pub_date'] = pub_date
+                article['date_found'] = True
+        
+        if not article['description']:
+            description = (meta.get('og:description') or meta.get('description') or '').strip()
+            if len(description) > DESCRIPTION_LENGTH:
+                description = description[:DESCRIPTION_LENGTH] + "..."
+            article['description'] = description
+    
+    def _localize_pacific(self, dt):
+        """Attach the Pacific timezone (PST or PDT) to a naive datetime"""
+        if HAS_PYTZ:
+            return self.pacific_tz.localize(dt)
+        return dt.replace(tzinfo=self.get_pacific_timezone(dt))
+    
     def parse_date_string(self, date_str):
-        """Parse date string with fallback methods, using Pacific Time (PST/PDT)"""
-        if HAS_DATEUTIL and HAS_PYTZ:
-            try:
-                # Parse the date
-                parsed_date = date_parser.parse(date_str)
-                if parsed_date.tzinfo is None:
-                    # If no timezone info, localize to Pacific Time
-                    parsed_date = self.pacific_tz.localize(parsed_date.replace(hour=12, minute=0, second=0))
-                else:
-                    # Convert to Pacific Time
-                    parsed_date = parsed_date.astimezone(self.pacific_tz)
-                return parsed_date.strftime('%a, %d %b %Y %H:%M:%S %z')
-            except:
-                pass
-        
-        # Fallback manual parsing for common formats
-        month_map = {
-            'january': 1, 'february': 2, 'march': 3, 'april': 4,
-            'may': 5, 'june': 6, 'july': 7, 'august': 8,
-            'september': 9, 'october': 10, 'november': 11, 'december': 12,
-            'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-            'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-        }
+        """Parse a date string into an RFC-822 date in Pacific Time, or None if it is not a date"""
+        date_str = date_str.strip()
         
-        # Try to match "Month Day, Year" format
-        month_day_year = re.match(r'([A-Za-z]+)\s+(\d{1,2}),?\s+(\d{4})', date_str.strip())
+        # Try to match "Month Day, Year" format first; it covers most dates on the site
+        month_day_year = _MONTH_DAY_YEAR_RE.match(date_str)
         if month_day_year:
             month_name = month_day_year.group(1).lower()
             day = int(month_day_year.group(2))
             year = int(month_day_year.group(3))
             
-            if month_name in month_map:
+            if month_name in _MONTH_MAP:
                 try:
-                    # Create datetime object
-                    dt = datetime(year, month_map[month_name], day, 12, 0, 0)
-                    # Apply appropriate Pacific timezone (PST or PDT)
-                    pacific_tz = self.get_pacific_timezone(dt)
-                    if HAS_PYTZ:
-                        dt_pacific = self.pacific_tz.localize(dt)
-                    else:
-                        dt_pacific = dt.replace(tzinfo=pacific_tz)
-                    return dt_pacific.strftime('%a, %d %b %Y %H:%M:%S %z')
-                except:
+                    # Create datetime object at noon, Pacific Time
+                    dt = datetime(year, _MONTH_MAP[month_name], day, 12, 0, 0)
+                    return format_datetime(self._localize_pacific(dt))
+                except ValueError:
                     pass
         
-        # Default fallback - use current time in Pacific timezone
-        now = datetime.now()
-        pacific_tz = self.get_pacific_timezone(now)
-        if HAS_PYTZ:
-            default_time = self.pacific_tz.localize(now)
-        else:
-            default_time = now.replace(tzinfo=pacific_tz)
-        return default_time.strftime('%a, %d %b %Y %H:%M:%S %z')
+        # ISO dates (YYYY-MM-DD, optionally with a time) parse natively,
+        # anything else goes through dateutil's generic parser
+        try:
+            parsed_date = datetime.fromisoformat(date_str)
+        except ValueError:
+            parsed_date = None
+        
+        if parsed_date is None and HAS_DATEUTIL:
+            try:
+                parsed_date = date_parser.parse(date_str)
+            except (ValueError, OverflowError):
+                pass
+        
+        if parsed_date is not None:
+            if parsed_date.tzinfo is None:
+                # If no timezone info, localize to Pacific Time
+                return format_datetime(self._localize_pacific(parsed_date.replace(hour=12, minute=0, second=0)))
+            # Convert to Pacific Time
+            return format_datetime(parsed_date.astimezone(self.get_pacific_timezone(parsed_date)))
+        
+        return None
 
-    def extract_date_from_text(self, text):
-        """Extract publication date from article text"""
-        # Look for "Posted on [date]" pattern
-        date_patterns = [
-            r'Posted on ([A-Za-z]+ \d{1,2}, \d{4})',
-            r'Published on ([A-Za-z]+ \d{1,2}, \d{4})',
-            r'([A-Za-z]+ \d{1,2}, \d{4})',
-            r'(\d{1,2}/\d{1,2}/\d{4})',
-            r'(\d{4}-\d{1,2}-\d{1,2})'
-        ]
-        
-        for pattern in date_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                date_str = match.group(1)
-                return self.parse_date_string(date_str)
-        
-        # Default to current time in Pacific timezone if no date found
-        now = datetime.now()
-        pacific_tz = self.get_pacific_timezone(now)
-        if HAS_PYTZ:
-            default_time = self.pacific_tz.localize(now)
-        else:
-            default_time = now.replace(tzinfo=pacific_tz)
-        return default_time.strftime('%a, %d %b %Y %H:%M:%S %z')
+    def extract_date_from_text(self, text, patterns=_DATE_PATTERNS):
+        """Return the first publication date found in text, or None"""
+        # Look for "Posted on [date]" pattern first, then bare dates; matches that
+        # only look like dates (e.g. "Ordinance 12, 2024") are skipped
+        for pattern in patterns:
+            for match in pattern.finditer(text):
+                pub_date = self.parse_date_string(match.group(1))
+                if pub_date:
+                    return pub_date
+        return None
 
     def extract_article_info(self, article_element):
         """Extract title, link, and description from an article element"""
-        # Get current Pacific time for default
-        now = datetime.now()
-        pacific_tz = self.get_pacific_timezone(now)
-        if HAS_PYTZ:
-            default_time = self.pacific_tz.localize(now)
-        else:
-            default_time = now.replace(tzinfo=pacific_tz)
-        
         info = {
             'title': '',
             'link': '',
             'description': '',
-            'pub_date': default_time.strftime('%a, %d %b %Y %H:%M:%S %z')
+            'pub_date': self._build_time(),
+            'date_found': False
         }
         
-        # Try to find title - look for various heading tags and link text
-        title_elem = (article_element.find(['h1', 'h2', 'h3', 'h4']) or 
-                     article_element.find('a') or
-                     article_element.find(class_=re.compile(r'title|headline', re.I)))
-        
-        if title_elem:
-            info['title'] = title_elem.get_text(strip=True)
+        # The body strings already leave out the title element
+        if HAS_SELECTOLAX:
+            title, href, strings = self._lexbor_article_parts(article_element)
+        else:
+            title, href, strings = self._soup_article_parts(article_element)
         
-        # Try to find link
-        link_elem = article_element.find('a', href=True)
-        if link_elem:
-            href = link_elem['href']
+        info['title'] = title
+        if href is not None:
             info['link'] = urljoin(self.base_url, href)
         
-        # Extract description from text content
-        # Remove title text from description
-        full_text = article_element.get_text(separator=' ', strip=True)
-        if info['title'] and full_text.startswith(info['title']):
-            description = full_text[len(info['title']):].strip()
-        else:
-            description = full_text
-        
-        # Extract publication date from the text
-        info['pub_date'] = self.extract_date_from_text(full_text)
+        # Collect body text only up to the budget; the description never needs more
+        parts = []
+        length = 0
+        truncated = False
+        for text in strings:
+            parts.append(text)
+            length += len(text) + 1
+            if length > TEXT_BUDGET:
+                truncated = True
+                break
+        description = ' '.join(parts)
+        
+        # Extract publication date from the title and body text. A "Posted on" date
+        # wins wherever it appears, so the rest of the body is only needed without one;
+        # it is read by resuming the interrupted walk.
+        date_text = f"{title} {description}"
+        pub_date = self.extract_date_from_text(date_text, (_POSTED_ON_RE,)) if truncated else None
+        if truncated and pub_date is None:
+            date_text = ' '.join(chain([date_text], strings))
+        pub_date = pub_date or self.extract_date_from_text(date_text)
+        if pub_date:
+            info['pub_date'] = pub_date
+            info['date_found'] = True
         
         # Clean up description - remove "Posted on [date]" prefix
-        description = re.sub(r'^Posted on [A-Za-z]+ \d{1,2}, \d{4}\s*', '', description, flags=re.IGNORECASE)
-        description = re.sub(r'^Published on [A-Za-z]+ \d{1,2}, \d{4}\s*', '', description, flags=re.IGNORECASE)
+        description = _POSTED_PREFIX_RE.sub('', description)
         
         # Limit description length and clean it up
-        if len(description) > 500:
-            description = description[:500] + "..."
+        if len(description) > DESCRIPTION_LENGTH:
+            description = description[:DESCRIPTION_LENGTH] + "..."
         
         info['description'] = description.strip()
         
         return info
     
-    def parse_news_page(self, html_content):
-        """Parse the news page and extract article information"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        articles = []
+    def _soup_article_parts(self, article_element):
+        """Return (title, href, body_strings) for a BeautifulSoup article element"""
+        # Try to find title - look for various heading tags and link text
+        title_elem = self._pick_title((elem.name, elem) for elem in _TITLE_SELECTOR.iselect(article_element))
+        title = title_elem.get_text(strip=True) if title_elem else ''
         
-        # Look for article containers - try multiple selectors
-        article_selectors = [
-            'article',
-            '.post',
-            '.news-item',
-            '.entry',
-            '[class*="post"]',
-            '[class*="article"]',
-            '[class*="news"]'
-        ]
+        # Try to find link
+        link_elem = article_element.find('a', href=True)
+        href = link_elem['href'] if link_elem else None
         
-        article_elements = []
-        for selector in article_selectors:
-            found = soup.select(selector)
-            if found:
-                article_elements = found
-                break
+        return title, href, self._soup_strings(article_element, skip=title_elem)
+    
+    def _lexbor_article_parts(self, article_node):
+        """Return (title, href, body_strings) for a selectolax article node"""
+        # Lexbor's css() also matches the node itself, unlike BeautifulSoup's descendant
+        # search, so leave the article node out of the candidates
+        article_id = article_node.mem_id
         
-        # If no specific article containers found, look for patterns in the content
-        if not article_elements:
-            # Look for divs or sections that contain links to news articles
-            potential_articles = soup.find_all(['div', 'section'], 
-                                             string=re.compile(r'.+', re.DOTALL))
-            
-            # Filter for elements that contain links to news articles
-            for elem in potential_articles:
-                links = elem.find_all('a', href=True)
-                if links and any('/news' in link.get('href', '') or 
-                              '/' in link.get('href', '') for link in links):
-                    article_elements.append(elem)
-        
-        # If still no articles found, try to find all links that look like news articles
-        if not article_elements:
-            all_links = soup.find_all('a', href=True)
-            for link in all_links:
-                href = link.get('href', '')
-                if ('/news' in href or href.startswith('/')) and link.get_text(strip=True):
-                    # Create a pseudo-article element
-                    article_elements.append(link.parent or link)
+        # Try to find title - look for various heading tags and link text
+        title_node = self._pick_title((node.tag, node) for node in article_node.css(TITLE_SELECTOR)
+                                      if node.mem_id != article_id)
+        title = title_node.text(strip=True) if title_node else ''
+        
+        link_node = next((node for node in article_node.css('a[href]') if node.mem_id != article_id), None)
+        href = (link_node.attributes.get('href') or '') if link_node else None
+        
+        return title, href, self._lexbor_strings(article_node, skip=title_node)
+    
+    def _pick_title(self, candidates):
+        """Pick the title element from (tag, element) pairs in document order
+        
+        The first heading wins, then the first link, then the first element with
+        a title-like class, so a single selector pass keeps the old preference.
+        """
+        first_link = first_titled = None
+        for tag, elem in candidates:
+            if tag in _HEADING_TAGS:
+                return elem
+            if tag == 'a':
+                if first_link is None:
+                    first_link = elem
+            elif first_titled is None:
+                first_titled = elem
+        return first_link if first_link is not None else first_titled
+    
+    def _soup_strings(self, elem, skip=None):
+        """Yield the stripped strings under elem, leaving out the skip element's subtree
+        
+        The walk is lazy, so callers can stop early and resume later.
+        """
+        stack = [elem]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Tag):
+                if node is not skip:
+                    stack.extend(reversed(node.contents))
+            elif type(node) is NavigableString:
+                # Exact type check excludes comments, scripts and styles like get_text()
+                text = node.strip()
+                if text:
+                    yield text
+    
+    def _lexbor_strings(self, node, skip=None):
+        """Yield the stripped text fragments under node, leaving out the skip node's subtree
+        
+        Only the path from node down to skip is walked in Python; every other subtree
+        is read with one C-level text() call. Script and style elements are stripped
+        from the tree in parse_news_page.
+        """
+        # Node equality compares serialized HTML, so identify nodes by mem_id
+        skip_id = skip.mem_id if skip is not None else None
+        path = {node.mem_id} if skip is not None else set()
+        ancestor = skip.parent if skip is not None else None
+        while ancestor is not None and ancestor.mem_id != node.mem_id:
+            path.add(ancestor.mem_id)
+            ancestor = ancestor.parent
+        
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if current.mem_id == skip_id:
+                continue
+            if current.mem_id in path:
+                stack.extend(reversed(list(current.iter(include_text=True))))
+            else:
+                # The NUL separator marks text node boundaries, like BeautifulSoup's strings
+                for text in current.text(separator='\x00', strip=True).split('\x00'):
+                    if text:
+                        yield text
+    
+    def parse_news_page(self, html_content):
+        """Parse the news page and extract article information"""
+        if HAS_SELECTOLAX:
+            tree = LexborHTMLParser(html_content)
+            # Lexbor's text() includes script and style contents, BeautifulSoup's does not
+            tree.strip_tags(['script', 'style'], recursive=True)
+            article_elements = self._find_lexbor_articles(tree)
+        else:
+            article_elements = self._find_soup_articles(BeautifulSoup(html_content, HTML_PARSER))
+        
+        articles = []
         
         # Extract information from found elements
         seen_links = set()
@@ -269,12 +576,14 @@ class BelvedereRSSGenerator:
                 article_info = self.extract_article_info(elem)
                 
                 # Skip if we don't have essential information or if it's a duplicate
-                if (not article_info['title'] or 
-                    not article_info['link'] or 
-                    article_info['link'] in seen_links):
+                if not article_info['title'] or not article_info['link']:
+                    continue
+                
+                canonical_link = _canonical(article_info['link'])
+                if canonical_link in seen_links:
                     continue
                 
-                seen_links.add(article_info['link'])
+                seen_links.add(canonical_link)
                 articles.append(article_info)
                 
             except Exception as e:
@@ -283,80 +592,120 @@ class BelvedereRSSGenerator:
         
         return articles
     
-    def generate_rss(self, articles, output_file=None):
-        """Generate RSS feed XML from articles"""
-        # Create RSS root element
-        rss = ET.Element('rss', version='2.0')
-        rss.set('xmlns:atom', 'http://www.w3.org/2005/Atom')
-        
-        # Create channel
-        channel = ET.SubElement(rss, 'channel')
+    def _find_soup_articles(self, soup):
+        """Locate candidate article elements in a BeautifulSoup document"""
+        # Try the selectors in priority order; the first usually matches
+        article_elements = []
+        for selector in _ARTICLE_SELECTOR_PRIORITY:
+            found = selector.select(soup)
+            if found:
+                article_elements = found
+                break
         
-        # Get current time in Pacific timezone for lastBuildDate
-        now = datetime.now()
-        pacific_tz = self.get_pacific_timezone(now)
-        if HAS_PYTZ:
-            current_time_pacific = self.pacific_tz.localize(now)
-        else:
-            current_time_pacific = now.replace(tzinfo=pacific_tz)
-        
-        # Add channel metadata
-        ET.SubElement(channel, 'title').text = 'City of Belvedere News'
-        ET.SubElement(channel, 'link').text = self.news_url
-        ET.SubElement(channel, 'description').text = 'Official news and updates from the City of Belvedere, California'
-        ET.SubElement(channel, 'language').text = 'en-us'
-        ET.SubElement(channel, 'lastBuildDate').text = current_time_pacific.strftime('%a, %d %b %Y %H:%M:%S %z')
-        ET.SubElement(channel, 'managingEditor').text = 'clerk@cityofbelvedere.org (City of Belvedere)'
-        ET.SubElement(channel, 'webMaster').text = 'clerk@cityofbelvedere.org (City of Belvedere)'
-        
-        # Add atom:link for self-reference
-        atom_link = ET.SubElement(channel, '{http://www.w3.org/2005/Atom}link')
-        atom_link.set('href', f"{self.base_url}/rss.xml")
-        atom_link.set('rel', 'self')
-        atom_link.set('type', 'application/rss+xml')
-        
-        # Add articles as items
-        for article in articles:
-            item = ET.SubElement(channel, 'item')
-            ET.SubElement(item, 'title').text = article['title']
-            ET.SubElement(item, 'link').text = article['link']
-            ET.SubElement(item, 'description').text = article['description']
-            ET.SubElement(item, 'pubDate').text = article['pub_date']
+        # If no specific article containers found, make one pass over the links to news
+        # articles, collecting the div or section around each one and, as a last resort,
+        # the links' parents
+        if not article_elements:
+            containers = []
+            seen_containers = set()
+            link_parents = []
+            for link in _LINK_SELECTOR.select(soup):
+                href = link.get('href', '')
+                if not ('/news' in href or href.startswith('/')):
+                    continue
+                
+                container = link.find_parent(['div', 'section'])
+                if container is not None and id(container) not in seen_containers:
+                    seen_containers.add(id(container))
+                    containers.append(container)
+                
+                if link.get_text(strip=True):
+                    # Create a pseudo-article element
+                    link_parents.append(link.parent or link)
             
-            # Use link as GUID
-            guid = ET.SubElement(item, 'guid')
-            guid.set('isPermaLink', 'true')
-            guid.text = article['link']
+            article_elements = containers or link_parents
         
-        # Generate XML string
-        rough_string = ET.tostring(rss, 'unicode')
+        return article_elements
+    
+    def _find_lexbor_articles(self, tree):
+        """Locate candidate article nodes in a selectolax document"""
+        # Try the selectors in priority order; the first usually matches
+        article_elements = []
+        for selector in ARTICLE_SELECTORS:
+            found = tree.css(selector)
+            if found:
+                article_elements = found
+                break
         
-        # Pretty print the XML
-        try:
-            from xml.dom import minidom
-            reparsed = minidom.parseString(rough_string)
-            pretty_xml = reparsed.toprettyxml(indent="  ")
+        # If no specific article containers found, make one pass over the links to news
+        # articles, collecting the div or section around each one and, as a last resort,
+        # the links' parents
+        if not article_elements:
+            containers = []
+            seen_containers = set()
+            link_parents = []
+            for link in tree.css('a[href]'):
+                href = link.attributes.get('href') or ''
+                if not ('/news' in href or href.startswith('/')):
+                    continue
+                
+                container = link.parent
+                while container is not None and container.tag not in ('div', 'section'):
+                    container = container.parent
+                if container is not None and container.mem_id not in seen_containers:
+                    seen_containers.add(container.mem_id)
+                    containers.append(container)
+                
+                if link.text(strip=True):
+                    # Create a pseudo-article element
+                    link_parents.append(link.parent or link)
             
-            # Remove empty lines and fix XML declaration
-            lines = [line for line in pretty_xml.split('\n') if line.strip()]
-            pretty_xml = '\n'.join(lines)
-        except:
-            # Fallback if minidom fails
-            pretty_xml = rough_string
-        
-        # Save to file or return
+            article_elements = containers or link_parents
+        
+        return article_elements
+    
+    def generate_rss(self, articles, output_file=None):
+        """Generate RSS feed XML from articles"""
+        header = _RSS_HEADER_TMPL.format(
+            link=escape(self.news_url),
+            last_build_date=self._build_time(),
+            self_link=quoteattr(f"{self.base_url}/rss.xml"))
+        
+        # Add articles as items, using the link as GUID
+        items = (_ITEM_TMPL.format(title=escape(article['title']),
+                                   link=escape(article['link']),
+                                   description=escape(article['description']),
+                                   pub_date=escape(article['pub_date']))
+                 for article in articles)
+        chunks = chain([header], items, [_RSS_FOOTER])
+        
+        # Stream to file or return
         if output_file:
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(pretty_xml)
+                f.writelines(chunks)
             print(f"RSS feed saved to {output_file}")
         else:
-            return pretty_xml
+            return ''.join(chunks)
     
     def run(self, output_file=None):
         """Main execution method"""
+        self._build_time_rfc822 = format_datetime(self._pacific_now())
+        
         print("Fetching Belvedere news page...")
+        self._cache = {}
+        if output_file:
+            # Validators are only valid for the feed they produced, so they are kept
+            # next to it and keyed by its name
+            self.cache_file = os.path.join(os.path.dirname(os.path.abspath(output_file)), CACHE_FILENAME)
+            if os.path.exists(output_file):
+                # Without a previous feed to fall back on, always download the full page
+                self._cache = self._load_cache().get(os.path.basename(output_file), {})
         html_content = self.fetch_page(self.news_url)
         
+        if html_content is NOT_MODIFIED:
+            print(f"News page unchanged since last run; keeping {output_file}")
+            return True
+        
         if not html_content:
             print("Failed to fetch news page")
             return False
@@ -375,9 +724,19 @@ class BelvedereRSSGenerator:
         if len(articles) > 5:
             print(f"  ... and {len(articles) - 5} more")
         
+        # Look up missing dates and descriptions on the article pages themselves
+        incomplete = [a for a in articles if not a['date_found'] or not a['description']]
+        if incomplete and HAS_AIOHTTP:
+            print(f"Fetching {len(incomplete)} article pages for missing details...")
+            asyncio.run(self.fetch_article_details(incomplete))
+        
         print("Generating RSS feed...")
         self.generate_rss(articles, output_file)
         
+        # Only remember the validators once the feed reflects this page
+        if output_file:
+            self._save_cache(output_file)
+        
         return True
 
 def main():
@@ -0,0 +1,48 @@
+import pytest
+
+import belvedere_rss_generator as rss
+
+
+@pytest.fixture(params=['selectolax', 'beautifulsoup'])
+def generator(request, monkeypatch):
+    """A generator running on each HTML backend in turn"""
+    if request.param == 'selectolax':
+        pytest.importorskip('selectolax.lexbor')
+        monkeypatch.setattr(rss, 'HAS_SELECTOLAX', True)
+    else:
+        monkeypatch.setattr(rss, 'HAS_SELECTOLAX', False)
+    return rss.BelvedereRSSGenerator()
+
+
+def test_multi_class_articles_are_found_once(generator):
+    # WordPress marks each article with several classes matching the selectors
+    html = ''.join(
+        f'<article class="post-{i} post type-post entry"><h2><a href="/story-{i}/">Story {i}</a></h2>'
+        f'<p>Posted on May {i + 1}, 2026</p></article>'
+        for i in range(15))
+    articles = generator.parse_news_page(html)
+    assert [a['title'] for a in articles] == [f'Story {i}' for i in range(15)]
+
+
+def test_heading_container_is_not_its_own_title(generator):
+    # With no article containers, a link's parent heading becomes the pseudo-article
+    html = '<h2><a href="/news/alpha">Alpha</a> Posted on June 2, 2026</h2>'
+    [article] = generator.parse_news_page(html)
+    assert article['title'] == 'Alpha'
+    assert article['pub_date'] == 'Tue, 02 Jun 2026 12:00:00 -0700'
+
+
+def test_date_in_title_is_found(generator):
+    html = '<article><h2><a href="/news/meeting">Meeting of May 5, 2026</a></h2><p>Agenda</p></article>'
+    [article] = generator.parse_news_page(html)
+    assert article['date_found']
+    assert article['pub_date'] == 'Tue, 05 May 2026 12:00:00 -0700'
+    assert article['description'] == 'Agenda'
+
+
+def test_date_past_text_budget_is_found(generator):
+    body = '<p>Lorem ipsum dolor sit amet.</p>' * 40
+    html = f'<article><h2><a href="/news/long">Long</a></h2>{body}<p>May 5, 2026</p></article>'
+    [article] = generator.parse_news_page(html)
+    assert article['pub_date'] == 'Tue, 05 May 2026 12:00:00 -0700'
+    assert 'May 5, 2026' not in article['description']